@@ -2,7 +2,9 @@
 LinkedIn Post Generator Agent Package
 
 This package provides a LinkedIn post generator system with automated review and feedback.
-It uses a loop agent for iterative refinement until quality requirements are met.
+Use arun (or run_batch_async) to run the pipeline from async code; run is a
+blocking convenience wrapper around arun.
 """
 
-from .agent import root_agent
\ No newline at end of file
+from .agent import root_agent
+from .runner import arun, run, run_batch_async
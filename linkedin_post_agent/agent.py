@@ -6,22 +6,63 @@ It uses a sequential agent that executes specialized sub-agents in a predefined
 with each agent's output feeding into the next agent in the sequence.
 """
 
-from google.adk.agents import SequentialAgent, ParallelAgent
+from typing import AsyncGenerator
 
+from google.adk.agents import BaseAgent, SequentialAgent, ParallelAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+
+from .prompts import REVIEW_APPROVED_MARKER
 from .subagents.post_generator import initial_post_generator
 from .subagents.post_refiner import post_refiner
 from .subagents.post_reviewer import post_reviewer
-from .subagents.hashtag_generator import hashtag_generator
-from .subagents.visual_finder import visual_finder
+from .subagents.post_enhancer import post_enhancer
 
-# Create the Parallel Enhancement Agent (works on initial post)
+# Create the Parallel Enhancement + Review Agent (works on initial post)
+# The reviewer only reads {current_post}, so it does not have to wait for the
+# hashtags and visuals; running it alongside the enhancer takes one full LLM
+# round-trip off the critical path before the refiner.
 enhancement_parallel = ParallelAgent(
     name="PostEnhancementParallel",
     sub_agents=[
-        hashtag_generator,
-        visual_finder,
+        post_enhancer,
+        post_reviewer,
     ],
-    description="Generates hashtags and finds visuals for the initial LinkedIn post in parallel",
+    description="Generates hashtags, finds visuals and reviews the initial LinkedIn post in parallel",
+)
+
+
+class RefinementGate(BaseAgent):
+    """
+    Runs its sub-agents only when the reviewer asked for changes, so an
+    approved post does not pay for a no-op refinement call. Approval is the
+    review_approved flag set by exit_loop, with the approval text as a fallback.
+    """
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        state = ctx.session.state
+        feedback = str(state.get("review_feedback", ""))
+        approved = bool(state.get("review_approved")) or (
+            REVIEW_APPROVED_MARKER.lower() in feedback.lower()
+        )
+        if approved or not feedback.strip():
+            print("\n----------- REFINEMENT SKIPPED -----------")
+            print("Reviewer approved the post, keeping it as is")
+            print("------------------------------------------\n")
+            return
+
+        for sub_agent in self.sub_agents:
+            async for event in sub_agent.run_async(ctx):
+                yield event
+
+
+# Create the Refinement Gate Agent (skips the refiner for approved posts)
+refinement_gate = RefinementGate(
+    name="PostRefinementGate",
+    sub_agents=[post_refiner],
+    description="Refines the post only when the review feedback requests changes",
 )
 
 # Create the Sequential Pipeline following proper sequential pattern
@@ -29,9 +70,8 @@ root_agent = SequentialAgent(
     name="LINKEDINPOSTGENERATIONPIPELINE",
     sub_agents=[
         initial_post_generator,  # Step 1: Generate initial post content
-        enhancement_parallel,    # Step 2: Generate hashtags and find visuals in parallel
-        post_reviewer,          # Step 3: Review and assess post quality
-        post_refiner,           # Step 4: Refine based on review feedback
+        enhancement_parallel,    # Step 2: Generate hashtags, find visuals and review quality in parallel
+        refinement_gate,         # Step 3: Refine based on review feedback, unless the post was approved
     ],
-    description="Sequential pipeline: generates initial post → enhances with hashtags/visuals → reviews quality → produces final refined post",
-)
\ No newline at end of file
+    description="Sequential pipeline: generates initial post → enhances with hashtags/visuals while reviewing quality → produces final refined post",
+)
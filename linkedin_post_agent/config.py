@@ -0,0 +1,30 @@
+"""
+Model Configuration
+
+This module selects the model backend shared by the LinkedIn post agents.
+
+By default every agent talks to Gemini. When LLM_API_BASE is set, the text-only
+agents are routed through LiteLLM to an OpenAI-compatible server instead (for
+example a self-hosted vLLM instance), so concurrent pipeline runs land in the
+same continuous batch.
+"""
+
+import os
+
+# Constants
+GEMINI_MODEL = "gemini-2.0-flash"
+
+LLM_MODEL = os.getenv("LLM_MODEL", "openai/llama-3.1-8b-instruct")
+LLM_API_BASE = os.getenv("LLM_API_BASE")
+LLM_API_KEY = os.getenv("LLM_API_KEY", "EMPTY")
+
+if LLM_API_BASE:
+    from google.adk.models.lite_llm import LiteLlm
+
+    # One shared client so every agent reuses the same connection pool
+    MODEL = LiteLlm(model=LLM_MODEL, api_base=LLM_API_BASE, api_key=LLM_API_KEY)
+else:
+    MODEL = GEMINI_MODEL
+
+# Optional JSON file used to persist the PostEnhancer semantic cache across restarts
+ENHANCER_CACHE_PATH = os.getenv("ENHANCER_CACHE_PATH")
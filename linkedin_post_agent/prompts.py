@@ -0,0 +1,56 @@
+"""
+Shared Prompt Fragments
+
+This module holds every agent instruction, built from the post requirements
+that the generator, reviewer and refiner all enforce, so the rules are written
+(and tokenized) in one terse form. It has no imports, so the instruction budget
+test can load it without ADK.
+"""
+
+CONTENT_REQS = "on-topic; concrete insights or examples; authentic enthusiasm; how readers can apply it; clear call-to-action"
+
+STYLE_REQS = "1000-1500 characters; professional yet conversational; no emojis, hashtags or fluff"
+
+# Every agent that reads the draft starts its instruction with the same text, so
+# the draft forms a common prefix that the backend's prefix cache can reuse
+POST_PREFIX = """## POST
+{current_post}
+
+## TASK
+"""
+
+# Returned by the reviewer when the post needs no refinement. The gate relies on the
+# review_approved flag set by exit_loop and only falls back to spotting the marker.
+REVIEW_APPROVED_MARKER = "Exiting the refinement loop"
+REVIEW_APPROVED = f"Post meets all requirements. {REVIEW_APPROVED_MARKER}."
+
+# Agent instructions, each kept within the ~120-token budget enforced by tests/test_prompts.py
+INITIAL_POST_INSTRUCTION = f"""Write a LinkedIn post on the user's topic.
+Content: {CONTENT_REQS}.
+Style: {STYLE_REQS}.
+Return only the post text.
+"""
+
+REVIEWER_INSTRUCTION = f"""{POST_PREFIX}Strictly review the post.
+Length check: {{length_check}}
+If the length check fails or any rule is unmet, return specific, actionable fixes.
+Content: {CONTENT_REQS}.
+Style: {STYLE_REQS}.
+Only if the post is excellent: call exit_loop and return "{REVIEW_APPROVED}"
+"""
+
+REFINER_INSTRUCTION = f"""{POST_PREFIX}Rewrite the post to apply this feedback, keeping its tone and theme:
+{{review_feedback}}
+Content: {CONTENT_REQS}.
+Style: {STYLE_REQS}.
+Return only the post text.
+"""
+
+ENHANCER_INSTRUCTION = (
+    POST_PREFIX
+    + """Run google_search once for professional visuals matching the post.
+Return only a JSON object:
+- "suggested_hashtags": 8-15 relevant CamelCase hashtags, popular and niche, e.g. "#Leadership #CareerGrowth"
+- "visual_recommendation": "search_query", "key_concepts" (3-5 strings), "primary" and "alternatives" (1-2), each with "type" (photo, infographic, illustration or other), "description", "url" (from the results, or "") and "usage"; then "strategy"
+"""
+)
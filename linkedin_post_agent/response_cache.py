@@ -0,0 +1,88 @@
+"""
+LLM Response Cache
+
+This module provides a small in-process cache for model responses. It plugs into
+an LlmAgent through its before/after model callbacks, so identical requests
+(same model, same rendered instruction, same conversation) are answered from
+memory instead of being sent to the model again.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of model responses keyed on a hash of the full request.
+
+    Usage:
+        cache = ResponseCache()
+        LlmAgent(
+            ...,
+            before_model_callback=cache.before_model,
+            after_model_callback=cache.after_model,
+        )
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._responses: "OrderedDict[str, LlmResponse]" = OrderedDict()
+        # Keys of requests currently waiting on the model, per agent invocation.
+        # Bounded too, since a request that errors never reaches after_model.
+        self._pending: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    @staticmethod
+    def request_key(llm_request: LlmRequest) -> str:
+        """Hash everything that influences the model output."""
+        digest = hashlib.sha256()
+        digest.update(str(llm_request.model).encode())
+        if llm_request.config and llm_request.config.system_instruction:
+            digest.update(str(llm_request.config.system_instruction).encode())
+        for content in llm_request.contents:
+            digest.update(content.model_dump_json(exclude_none=True).encode())
+        return digest.hexdigest()
+
+    def before_model(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """Return the cached response for this request, skipping the model call."""
+        key = self.request_key(llm_request)
+
+        cached = self._responses.get(key)
+        if cached is None:
+            pending_id = (callback_context.invocation_id, callback_context.agent_name)
+            self._pending[pending_id] = key
+            self._pending.move_to_end(pending_id)
+            while len(self._pending) > self.maxsize:
+                self._pending.popitem(last=False)
+            return None
+
+        self._responses.move_to_end(key)
+        print(f"\n----------- CACHE HIT ({callback_context.agent_name}) -----------\n")
+        return cached.model_copy(deep=True)
+
+    def after_model(
+        self, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        """Store complete, successful responses for the request that produced them."""
+        # Streaming calls this for every chunk; keep the key for the final response
+        if llm_response.partial:
+            return None
+
+        pending_id = (callback_context.invocation_id, callback_context.agent_name)
+        key = self._pending.pop(pending_id, None)
+        if not key or llm_response.error_code:
+            return None
+        if not llm_response.content or not llm_response.content.parts:
+            return None
+
+        self._responses[key] = llm_response.model_copy(deep=True)
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.maxsize:
+            self._responses.popitem(last=False)
+        return None
@@ -0,0 +1,89 @@
+"""
+LinkedIn Post Generator Runner
+
+This module provides the programmatic entrypoints for running the pipeline
+outside the ADK api server. Everything is async: serving or batch workloads
+should await arun (or run_batch_async) directly so many pipelines share the
+event loop and the model backend can batch their requests. run is only a
+convenience wrapper for scripts.
+"""
+
+import asyncio
+import uuid
+from typing import Any, Dict, List, Union
+
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from .agent import root_agent
+
+# Constants
+APP_NAME = "linkedin_post_agent"
+USER_ID = "user"
+
+# Match the backend's concurrent sequence limit (e.g. vLLM --max-num-seqs)
+BATCH_CONCURRENCY = 32
+
+
+async def arun(topic: str, session_id: str) -> Dict[str, Any]:
+    """
+    Run the pipeline for one topic.
+
+    Uses the default, non-streaming run config: events are not consumed here,
+    and the pinned ADK's LiteLlm streaming path blocks the event loop.
+
+    Args:
+        topic: Topic or request to generate a LinkedIn post for
+        session_id: Identifier for the pipeline's session
+
+    Returns:
+        Dict[str, Any]: Final session state, containing current_post,
+            suggested_hashtags, visual_recommendations (markdown) and
+            visual_recommendation_data (structured dict, or None if the
+            enhancer's answer could not be parsed)
+    """
+    session_service = InMemorySessionService()
+    runner = Runner(app_name=APP_NAME, agent=root_agent, session_service=session_service)
+    session_service.create_session(app_name=APP_NAME, user_id=USER_ID, session_id=session_id)
+
+    message = types.Content(role="user", parts=[types.Part(text=topic)])
+    async for _ in runner.run_async(user_id=USER_ID, session_id=session_id, new_message=message):
+        pass
+
+    session = session_service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session_id)
+    return dict(session.state)
+
+
+def run(topic: str, session_id: str) -> Dict[str, Any]:
+    """Synchronous wrapper around arun for scripts; do not use it in servers."""
+    return asyncio.run(arun(topic, session_id))
+
+
+async def run_batch_async(
+    topics: List[str], max_concurrency: int = BATCH_CONCURRENCY
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Run the pipeline for every topic concurrently so the model backend can
+    batch the requests instead of serving them one pipeline at a time.
+
+    A failing topic (quota, invalid model output, transient errors) does not
+    discard the others: its slot holds the exception instead of a state.
+
+    Args:
+        topics: Topics or requests to generate LinkedIn posts for
+        max_concurrency: Maximum number of pipelines in flight at once
+
+    Returns:
+        List[Union[Dict[str, Any], Exception]]: In topic order, the final session
+            state of each successful run or the exception raised by a failed one
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(topic: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await arun(topic, session_id=uuid.uuid4().hex)
+
+    return await asyncio.gather(
+        *(run_one(topic) for topic in topics), return_exceptions=True
+    )
@@ -9,5 +9,4 @@ This package provides all subagents used in the LinkedIn post generation system.
 from .post_generator import initial_post_generator
 from .post_refiner import post_refiner
 from .post_reviewer import post_reviewer
-from .hashtag_generator import hashtag_generator
-from .visual_finder import visual_finder
\ No newline at end of file
+from .post_enhancer import post_enhancer
\ No newline at end of file
@@ -1,10 +0,0 @@
-"""
-Hashtag Generator Agent Package
-
-This package contains the hashtag generator agent that analyzes content
-and user input to suggest relevant hashtags for better LinkedIn post reach.
-"""
-
-from .agent import hashtag_generator
-
-__all__ = ['hashtag_generator']
\ No newline at end of file
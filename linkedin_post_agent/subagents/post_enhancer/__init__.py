@@ -0,0 +1,10 @@
+"""
+Post Enhancer Agent Package
+
+This package contains the post enhancer agent that suggests hashtags and finds
+relevant visuals for a LinkedIn post in a single model call.
+"""
+
+from .agent import post_enhancer
+
+__all__ = ['post_enhancer']
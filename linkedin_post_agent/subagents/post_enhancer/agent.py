@@ -0,0 +1,42 @@
+"""
+LinkedIn Post Enhancer Agent
+
+This agent analyzes the LinkedIn post content once and returns both the hashtag
+suggestions and the visual recommendation in a single JSON response.
+"""
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.tools import google_search
+
+from ...config import ENHANCER_CACHE_PATH, GEMINI_MODEL
+from ...prompts import ENHANCER_INSTRUCTION
+from .cache import SemanticCache, SemanticCacheAgent
+from .callbacks import split_enhancements
+
+# Near-identical posts get the same hashtags and visuals without a new search.
+# Entries are versioned on the model and instruction, so prompt changes start fresh.
+semantic_cache = SemanticCache(
+    version=f"{GEMINI_MODEL}\n{ENHANCER_INSTRUCTION}", path=ENHANCER_CACHE_PATH
+)
+
+# Define the Post Enhancer Agent
+enhancer_llm = LlmAgent(
+    name="PostEnhancer",
+    # google_search is Gemini grounding, so this agent always stays on Gemini
+    model=GEMINI_MODEL,
+    instruction=ENHANCER_INSTRUCTION,
+    description="Suggests hashtags and uses Google search to find visuals for LinkedIn posts in one call",
+    tools=[google_search],
+    output_key="post_enhancements",
+    before_model_callback=semantic_cache.before_model,
+    after_model_callback=semantic_cache.after_model,
+    after_agent_callback=split_enhancements,
+)
+
+# Embed the post off the event loop before the enhancer's cache lookup
+post_enhancer = SemanticCacheAgent(
+    name="PostEnhancerCache",
+    cache=semantic_cache,
+    sub_agents=[enhancer_llm],
+    description="Looks up cached enhancements for similar posts before running the PostEnhancer",
+)
@@ -0,0 +1,214 @@
+"""
+Semantic Cache for LinkedIn Post Enhancer Agent
+
+This module caches the enhancer's search-grounded answers keyed on an embedding
+of the post. A new post whose embedding is close enough to a previous one reuses
+that answer, skipping both the Google search and the model call.
+
+Model callbacks are synchronous, so the embedding request cannot run inside
+them without blocking the event loop. SemanticCacheAgent awaits it before the
+wrapped agent runs; the callbacks then only do in-memory lookups.
+"""
+
+import atexit
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
+from typing import AsyncGenerator, List, Optional, Tuple
+
+from google import genai
+from google.adk.agents import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+# Constants
+EMBEDDING_MODEL = "text-embedding-004"
+SIMILARITY_THRESHOLD = 0.92
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+def _post_key(post: str) -> str:
+    return hashlib.sha256(post.encode()).hexdigest()
+
+
+class SemanticCache:
+    """
+    Bounded cache of model responses looked up by cosine similarity between
+    embeddings of current_post.
+
+    Entries are tagged with a hash of version (e.g. model + instruction), so
+    answers saved under an older prompt or output format are not served.
+
+    Usage:
+        cache = SemanticCache(version=GEMINI_MODEL + INSTRUCTION)
+        agent = LlmAgent(
+            ...,
+            before_model_callback=cache.before_model,
+            after_model_callback=cache.after_model,
+        )
+        SemanticCacheAgent(name=..., cache=cache, sub_agents=[agent])
+    """
+
+    def __init__(
+        self,
+        version: str,
+        threshold: float = SIMILARITY_THRESHOLD,
+        maxsize: int = 512,
+        path: Optional[str] = None,
+    ):
+        self.namespace = hashlib.sha256(version.encode()).hexdigest()
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.path = path
+        self._client: Optional[genai.Client] = None
+        self._entries: List[Tuple[List[float], LlmResponse]] = []
+        # Embeddings computed by SemanticCacheAgent, keyed on a hash of the post
+        self._post_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+
+        if path:
+            self.load()
+            atexit.register(self.save)
+
+    async def embed_post(self, post: str) -> None:
+        """Embed post without blocking the event loop; failures are treated as a miss."""
+        key = _post_key(post)
+        if key in self._post_embeddings:
+            self._post_embeddings.move_to_end(key)
+            return
+        try:
+            if self._client is None:
+                self._client = genai.Client()
+            result = await self._client.aio.models.embed_content(
+                model=EMBEDDING_MODEL, contents=post
+            )
+            embedding = _normalize(result.embeddings[0].values)
+        except Exception as error:
+            print("\n----------- SEMANTIC CACHE DEBUG -----------")
+            print(f"Embedding failed, skipping cache: {error}")
+            print("--------------------------------------------\n")
+            return
+
+        self._post_embeddings[key] = embedding
+        while len(self._post_embeddings) > self.maxsize:
+            self._post_embeddings.popitem(last=False)
+
+    def _embedding_for(self, callback_context: CallbackContext) -> Optional[List[float]]:
+        post = str(callback_context.state.get("current_post", ""))
+        return self._post_embeddings.get(_post_key(post)) if post else None
+
+    def lookup(self, embedding: List[float]) -> Optional[LlmResponse]:
+        """Return the stored response most similar to embedding, if above threshold."""
+        best_score, best_response = 0.0, None
+        for stored, response in self._entries:
+            score = sum(a * b for a, b in zip(stored, embedding))
+            if score > best_score:
+                best_score, best_response = score, response
+        if best_score < self.threshold:
+            return None
+        return best_response
+
+    def before_model(
+        self, callback_context: CallbackContext, llm_request: LlmRequest
+    ) -> Optional[LlmResponse]:
+        """Answer from the cache when a sufficiently similar post was seen before."""
+        embedding = self._embedding_for(callback_context)
+        cached = self.lookup(embedding) if embedding is not None else None
+        if cached is None:
+            return None
+
+        print(f"\n----------- SEMANTIC CACHE HIT ({callback_context.agent_name}) -----------\n")
+        return cached.model_copy(deep=True)
+
+    def after_model(
+        self, callback_context: CallbackContext, llm_response: LlmResponse
+    ) -> Optional[LlmResponse]:
+        """Store the final text answer against the embedding of its post."""
+        # Streaming calls this for every chunk; only the final response is stored
+        if llm_response.partial or llm_response.error_code:
+            return None
+        if not llm_response.content or not llm_response.content.parts:
+            return None
+        if not any(part.text for part in llm_response.content.parts):
+            return None
+
+        embedding = self._embedding_for(callback_context)
+        if embedding is None or self.lookup(embedding) is not None:
+            return None
+
+        self._entries.append((embedding, llm_response.model_copy(deep=True)))
+        if len(self._entries) > self.maxsize:
+            self._entries.pop(0)
+        return None
+
+    def load(self) -> None:
+        """Load entries saved under the same version from self.path, if it exists."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                saved = json.load(cache_file)
+            if saved.get("namespace") != self.namespace:
+                return
+            self._entries = [
+                (entry["embedding"], LlmResponse.model_validate(entry["response"]))
+                for entry in saved["entries"]
+            ][-self.maxsize :]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+            print("\n----------- SEMANTIC CACHE DEBUG -----------")
+            print(f"Ignoring unreadable cache file {self.path}: {error}")
+            print("--------------------------------------------\n")
+            self._entries = []
+
+    def save(self) -> None:
+        """Write all entries to self.path, replacing it atomically."""
+        if not self.path:
+            return
+        saved = {
+            "namespace": self.namespace,
+            "entries": [
+                {
+                    "embedding": embedding,
+                    "response": response.model_dump(mode="json", exclude_none=True),
+                }
+                for embedding, response in self._entries
+            ],
+        }
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(saved, cache_file)
+            os.replace(temp_path, self.path)
+        except OSError as error:
+            print("\n----------- SEMANTIC CACHE DEBUG -----------")
+            print(f"Could not write cache file {self.path}: {error}")
+            print("--------------------------------------------\n")
+
+
+class SemanticCacheAgent(BaseAgent):
+    """
+    Embeds current_post for its cache, then runs its sub-agents, whose model
+    callbacks look the embedding up.
+    """
+
+    cache: SemanticCache
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        post = str(ctx.session.state.get("current_post", ""))
+        if post:
+            await self.cache.embed_post(post)
+
+        for sub_agent in self.sub_agents:
+            async for event in sub_agent.run_async(ctx):
+                yield event
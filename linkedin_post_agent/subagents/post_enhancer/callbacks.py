@@ -0,0 +1,127 @@
+"""
+Callbacks for LinkedIn Post Enhancer Agent
+
+This module splits the enhancer's single JSON answer into the separate state
+keys consumed by the frontend and other callers.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Literal, Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+from pydantic import BaseModel, ValidationError, field_validator
+
+# Constants
+VISUAL_TYPES = ("photo", "infographic", "illustration")
+
+
+class VisualHit(BaseModel):
+    """One visual found through Google search."""
+
+    type: Literal["photo", "infographic", "illustration", "other"]
+    description: str
+    url: str = ""
+    usage: str = ""
+
+    @field_validator("type", mode="before")
+    @classmethod
+    def _coerce_type(cls, value: Any) -> str:
+        """Map free-form types such as "stock photo" onto the known ones."""
+        text = str(value).lower()
+        for visual_type in VISUAL_TYPES:
+            if visual_type in text:
+                return visual_type
+        return "other"
+
+
+class VisualRecommendation(BaseModel):
+    """The recommended visual plus backups, as returned by the enhancer."""
+
+    search_query: str
+    key_concepts: List[str]
+    primary: VisualHit
+    alternatives: List[VisualHit] = []
+    strategy: str = ""
+
+
+class PostEnhancements(BaseModel):
+    """Shape of the JSON object the enhancer is asked to return."""
+
+    suggested_hashtags: str
+    visual_recommendation: VisualRecommendation
+
+
+def _extract_json(raw: str) -> Dict[str, Any]:
+    """Pull the first JSON object out of a model answer, tolerating code fences."""
+    start, end = raw.find("{"), raw.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        parsed = json.loads(raw[start : end + 1])
+    except ValueError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def render_visual_markdown(visual: VisualRecommendation) -> str:
+    """Render a visual recommendation in the markdown sections the frontend parses."""
+    alternatives = "; ".join(
+        f"{hit.description} ({hit.url})" if hit.url else hit.description
+        for hit in visual.alternatives
+    )
+    return "\n".join(
+        [
+            f"**SEARCH QUERY USED:** {visual.search_query}",
+            "",
+            f"**KEY VISUAL CONCEPTS:** {', '.join(visual.key_concepts)}",
+            "",
+            "**RECOMMENDED VISUAL:**",
+            f"- **Type:** {visual.primary.type}",
+            f"- **Description:** {visual.primary.description}",
+            f"- **Source/URL:** {visual.primary.url or 'Not available'}",
+            f"- **Usage:** {visual.primary.usage}",
+            "",
+            f"**ALTERNATIVE OPTIONS:** {alternatives or 'None'}",
+            "",
+            f"**VISUAL STRATEGY:** {visual.strategy}",
+        ]
+    )
+
+
+def split_enhancements(callback_context: CallbackContext) -> Optional[types.Content]:
+    """
+    After-agent callback that fans the enhancer output out to
+    suggested_hashtags, visual_recommendation_data and visual_recommendations.
+
+    visual_recommendation_data holds the structured dict; visual_recommendations
+    keeps the markdown rendering shown by the frontend. If the model did not
+    return valid JSON, hashtags are recovered from the raw text, the whole
+    answer is kept as the visual recommendations and
+    visual_recommendation_data is set to None.
+
+    Args:
+        callback_context: Context for accessing and updating session state
+
+    Returns:
+        None, so the agent's own response is kept
+    """
+    raw = str(callback_context.state.get("post_enhancements", ""))
+
+    try:
+        enhancements = PostEnhancements.model_validate(_extract_json(raw))
+    except ValidationError:
+        print("\n----------- ENHANCER DEBUG -----------")
+        print("Enhancer output was not valid JSON, falling back to raw text")
+        print("--------------------------------------\n")
+        callback_context.state["suggested_hashtags"] = " ".join(re.findall(r"#\w+", raw))
+        callback_context.state["visual_recommendation_data"] = None
+        callback_context.state["visual_recommendations"] = raw
+        return None
+
+    visual = enhancements.visual_recommendation
+    callback_context.state["suggested_hashtags"] = enhancements.suggested_hashtags
+    callback_context.state["visual_recommendation_data"] = visual.model_dump()
+    callback_context.state["visual_recommendations"] = render_visual_markdown(visual)
+    return None
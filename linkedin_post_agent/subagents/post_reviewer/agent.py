@@ -6,58 +6,24 @@ This agent reviews LinkedIn posts for quality and provides feedback.
 
 from google.adk.agents.llm_agent import LlmAgent
 
-from .tools import count_characters, exit_loop
+from ...config import MODEL
+from ...prompts import REVIEWER_INSTRUCTION
+from ...response_cache import ResponseCache
+from .callbacks import check_post_length
+from .tools import exit_loop
 
-# Constants
-GEMINI_MODEL = "gemini-2.0-flash"
+# Identical drafts are common while iterating on a topic; reuse the previous answer
+response_cache = ResponseCache(maxsize=512)
 
 # Define the Post Reviewer Agent
 post_reviewer = LlmAgent(
     name="PostReviewer",
-    model=GEMINI_MODEL,
-    instruction="""You are a LinkedIn Post Quality Reviewer.
-
-Your task is to evaluate the quality of a LinkedIn post based on specified criteria.
-
-## EVALUATION PROCESS
-1. Use the count_characters tool to check the post's length.
-   Pass the post text directly to the tool.
-
-2. If the length check fails (tool result is "fail"), provide specific feedback on what needs to be fixed.
-   Use the tool's message as a guideline, but add your own professional critique.
-
-3. If length check passes, evaluate the post against these STRICT criteria:
-   - CONTENT REQUIREMENTS (ALL must be met):
-     1. Has clear and valuable content that provides insights
-     2. Includes relevant examples, details, or personal experiences
-     3. Has a clear call-to-action that encourages engagement
-     4. Shows genuine enthusiasm and authentic voice
-     5. Provides practical value that readers can apply
-   
-   - STYLE REQUIREMENTS (ALL must be met):
-     1. Professional yet conversational tone
-     2. Clear and engaging writing style
-     3. Well-structured with good flow
-     4. Appropriate formatting and readability
-     5. Authentic voice without generic corporate speak
-
-4. Be CRITICAL in your evaluation. Only call exit_loop if the post is truly excellent and meets ALL criteria above.
-
-## OUTPUT INSTRUCTIONS
-IF the post fails length check OR fails ANY of the quality criteria:
-  - Return specific, actionable feedback on what to improve
-  - Focus on the most important improvements needed
-  
-ELSE IF the post meets ALL requirements AND is truly excellent:
-  - Call the exit_loop function
-  - Return "Post meets all requirements. Exiting the refinement loop."
-  
-Be strict in your evaluation. Most posts will need improvement.
-
-## POST TO REVIEW
-{current_post}
-""",
-    description="Reviews post quality and provides feedback on what to improve or exits the loop if requirements are met",
-    tools=[count_characters, exit_loop],
+    model=MODEL,
+    instruction=REVIEWER_INSTRUCTION,
+    description="Reviews post quality and provides feedback on what to improve, or approves the post if requirements are met",
+    tools=[exit_loop],
     output_key="review_feedback",
-)
\ No newline at end of file
+    before_agent_callback=check_post_length,
+    before_model_callback=response_cache.before_model,
+    after_model_callback=response_cache.after_model,
+)
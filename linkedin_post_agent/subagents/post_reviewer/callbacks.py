@@ -0,0 +1,54 @@
+"""
+Callbacks for LinkedIn Post Reviewer Agent
+
+This module runs the deterministic checks of the review locally, before the
+reviewer's model call, so the model only has to do the qualitative review.
+"""
+
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+
+# Constants
+MIN_LENGTH = 1000
+MAX_LENGTH = 1500
+
+
+def check_post_length(callback_context: CallbackContext) -> Optional[types.Content]:
+    """
+    Before-agent callback that checks the length of current_post.
+    Updates review_status and length_check in the state based on length requirements,
+    and clears review_approved so only this review's exit_loop call can approve.
+
+    Args:
+        callback_context: Context for accessing and updating session state
+
+    Returns:
+        None, so the reviewer still runs
+    """
+    char_count = len(str(callback_context.state.get("current_post", "")))
+    callback_context.state["review_approved"] = False
+
+    print("\n----------- LENGTH CHECK DEBUG -----------")
+    print(f"Checking text length: {char_count} characters")
+    print("------------------------------------------\n")
+
+    if char_count < MIN_LENGTH:
+        chars_needed = MIN_LENGTH - char_count
+        callback_context.state["review_status"] = "fail"
+        callback_context.state["length_check"] = (
+            f"fail: post is too short ({char_count} characters). Add {chars_needed} more "
+            f"characters to reach minimum length of {MIN_LENGTH}."
+        )
+    elif char_count > MAX_LENGTH:
+        chars_to_remove = char_count - MAX_LENGTH
+        callback_context.state["review_status"] = "fail"
+        callback_context.state["length_check"] = (
+            f"fail: post is too long ({char_count} characters). Remove {chars_to_remove} "
+            f"characters to meet maximum length of {MAX_LENGTH}."
+        )
+    else:
+        callback_context.state["review_status"] = "pass"
+        callback_context.state["length_check"] = f"pass: post length is good ({char_count} characters)."
+    return None
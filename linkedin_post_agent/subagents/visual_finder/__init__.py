@@ -1,10 +0,0 @@
-"""
-Visual Finder Agent Package
-
-This package contains the visual finder agent that uses Google ADK tools
-to find relevant visuals for LinkedIn posts based on content and user input.
-"""
-
-from .agent import visual_finder
-
-__all__ = ['visual_finder']
\ No newline at end of file
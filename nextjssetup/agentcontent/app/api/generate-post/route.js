@@ -200,14 +200,15 @@ export async function POST(req) {
       agentData.forEach((response, index) => {
         console.log(`Checking response ${index} from author: ${response.author}`);
         
-        // Extract post content from PostRefinerAgent (final post)
-        if (response.author === "PostRefinerAgent" && response.actions?.state_delta?.current_post) {
+        // Extract post content from the last agent that set it: PostRefinerAgent,
+        // or InitialPostGenerator when the refinement gate skipped an approved post
+        if (response.actions?.state_delta?.current_post) {
           generatedPost = response.actions.state_delta.current_post;
-          console.log("Found refined post content");
+          console.log(`Found post content from ${response.author}`);
         }
         
-        // Extract hashtags from HashtagGenerator
-        if (response.author === "HashtagGenerator" && response.actions?.state_delta?.suggested_hashtags) {
+        // Extract hashtags from PostEnhancer
+        if (response.author === "PostEnhancer" && response.actions?.state_delta?.suggested_hashtags) {
           const hashtagText = response.actions.state_delta.suggested_hashtags;
           const hashtagMatches = hashtagText.match(/#[\w]+/g);
           if (hashtagMatches) {
@@ -216,8 +217,8 @@ export async function POST(req) {
           }
         }
         
-        // Extract visual recommendations from VisualFinder
-        if (response.author === "VisualFinder" && response.actions?.state_delta?.visual_recommendations) {
+        // Extract visual recommendations from PostEnhancer
+        if (response.author === "PostEnhancer" && response.actions?.state_delta?.visual_recommendations) {
           visualSuggestions = [response.actions.state_delta.visual_recommendations];
           console.log("Found visual recommendations");
         }
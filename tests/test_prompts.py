@@ -0,0 +1,43 @@
+"""
+Tests for the agent instruction budget.
+
+Prefill dominates these short-output calls, so every static instruction must
+stay within ~120 tokens (480 characters at ~4 characters per token).
+"""
+
+import importlib.util
+import re
+from pathlib import Path
+
+import pytest
+
+# Load prompts.py by path: importing the package would pull in google-adk
+PROMPTS_PATH = Path(__file__).resolve().parent.parent / "linkedin_post_agent" / "prompts.py"
+_spec = importlib.util.spec_from_file_location("prompts", PROMPTS_PATH)
+prompts = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(prompts)
+
+MAX_STATIC_CHARS = 480
+
+INSTRUCTIONS = {
+    "InitialPostGenerator": prompts.INITIAL_POST_INSTRUCTION,
+    "PostReviewer": prompts.REVIEWER_INSTRUCTION,
+    "PostRefinerAgent": prompts.REFINER_INSTRUCTION,
+    "PostEnhancer": prompts.ENHANCER_INSTRUCTION,
+}
+
+
+def static_text(instruction: str) -> str:
+    """Drop ADK state placeholders such as {current_post}."""
+    return re.sub(r"\{[a-z_]+\}", "", instruction)
+
+
+@pytest.mark.parametrize("agent_name", sorted(INSTRUCTIONS))
+def test_instruction_within_token_budget(agent_name):
+    length = len(static_text(INSTRUCTIONS[agent_name]))
+    assert length <= MAX_STATIC_CHARS, f"{agent_name} instruction is {length} characters"
+
+
+@pytest.mark.parametrize("agent_name", ["PostReviewer", "PostRefinerAgent", "PostEnhancer"])
+def test_post_consumers_share_prefix(agent_name):
+    assert INSTRUCTIONS[agent_name].startswith(prompts.POST_PREFIX)